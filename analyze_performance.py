@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Performance analysis for the deployed vLLM endpoint.
+
+Sends single and concurrent chat-completion probes to the OpenAI-compatible
+API and reports latency, token throughput, and parallel speedup.
+
+Requires: pip install aiohttp
+
+Usage:
+    API_URL=https://your-koyeb-app.koyeb.app python analyze_performance.py
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+API_URL = os.environ.get("API_URL", "http://localhost:8000")
+API_KEY = os.environ.get("VLLM_API_KEY")
+MODEL = os.environ.get("MODEL", "DragonLLM/Qwen-Open-Finance-R-8B")
+
+ENGLISH_QUESTIONS = [
+    "What is a stock?",
+    "What is a bond?",
+    "What is compound interest?",
+]
+
+FRENCH_QUESTIONS = [
+    "Qu'est-ce qu'une action ?",
+    "Qu'est-ce qu'une obligation ?",
+    "Qu'est-ce que les intérêts composés ?",
+]
+
+
+def _headers():
+    headers = {"Content-Type": "application/json"}
+    if API_KEY:
+        headers["Authorization"] = f"Bearer {API_KEY}"
+    return headers
+
+
+def encode_body(question, max_tokens=50, stream=False):
+    """Serialize a chat-completion payload once, for reuse across requests."""
+    payload = {
+        "model": MODEL,
+        "messages": [{"role": "user", "content": question}],
+        "temperature": 0.2,
+        "max_tokens": max_tokens,
+    }
+    if stream:
+        payload["stream"] = True
+    return json.dumps(payload).encode()
+
+
+async def make_request(session, body, index):
+    """Send one pre-encoded chat completion and return timing/token stats."""
+    start = time.perf_counter()
+    try:
+        async with session.post(
+            f"{API_URL}/v1/chat/completions",
+            data=body,
+            headers=_headers(),
+            timeout=aiohttp.ClientTimeout(total=90),
+        ) as response:
+            data = await response.json()
+            elapsed = time.perf_counter() - start
+            if response.status != 200:
+                return {"index": index, "success": False, "time": elapsed,
+                        "error": f"HTTP {response.status}"}
+            tokens = data.get("usage", {}).get("completion_tokens", 0)
+            return {"index": index, "success": True, "time": elapsed,
+                    "tokens": tokens}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        return {"index": index, "success": False,
+                "time": time.perf_counter() - start, "error": str(exc)}
+
+
+async def test_single_request(session):
+    """Baseline: one request, no concurrency."""
+    result = await make_request(session, encode_body(ENGLISH_QUESTIONS[0]), 0)
+    if result["success"]:
+        tps = result["tokens"] / result["time"] if result["time"] else 0.0
+        logger.info(
+            "=== Single Request Baseline ===\n"
+            "Time: %.2fs\nTokens: %d\nThroughput: %.2f tok/s",
+            result["time"], result["tokens"], tps,
+        )
+    else:
+        logger.error("Single request failed: %s", result["error"])
+    return result
+
+
+async def test_streaming_request(session):
+    """Stream one completion and time first token vs full response."""
+    body = encode_body(ENGLISH_QUESTIONS[0], max_tokens=150, stream=True)
+    start = time.perf_counter()
+    first_token_at = None
+    chunks = 0
+    try:
+        async with session.post(
+            f"{API_URL}/v1/chat/completions",
+            data=body,
+            headers=_headers(),
+            timeout=aiohttp.ClientTimeout(total=90),
+        ) as response:
+            if response.status != 200:
+                logger.error("Streaming request failed: HTTP %d", response.status)
+                return None
+            async for line in response.content:
+                if not line.startswith(b"data: "):
+                    continue
+                if line[6:].strip() == b"[DONE]":
+                    break
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunks += 1
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        logger.error("Streaming request failed: %s", exc)
+        return None
+    total = time.perf_counter() - start
+    ttft = (first_token_at - start) if first_token_at else total
+    logger.info(
+        "=== Streaming Request (TTFT) ===\n"
+        "Time to first token: %.2fs\nTotal time: %.2fs (%d chunks)",
+        ttft, total, chunks,
+    )
+    return {"ttft": ttft, "total": total, "chunks": chunks}
+
+
+async def test_concurrent_requests(session, num_requests):
+    """Fire num_requests questions at once and measure parallel speedup."""
+    questions = (ENGLISH_QUESTIONS + FRENCH_QUESTIONS) * 2
+    questions = questions[:num_requests]
+    # Serialize every payload up front so no JSON encoding happens during
+    # the timed burst.
+    bodies = [encode_body(q) for q in questions]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[make_request(session, body, i) for i, body in enumerate(bodies)]
+    )
+    wall_time = time.perf_counter() - start
+
+    # Single pass: collect the per-request lines and accumulate aggregates,
+    # then emit the whole section as one log record.
+    lines = [f"=== Concurrent Requests (n={num_requests}) ==="]
+    n_ok = 0
+    total_time = 0.0
+    total_tokens = 0
+    max_time = 0.0
+    for r in results:
+        if r["success"]:
+            lines.append(f"  Request {r['index']}: {r['time']:.2f}s, "
+                         f"{r['tokens']} tokens")
+            n_ok += 1
+            total_time += r["time"]
+            total_tokens += r["tokens"]
+            if r["time"] > max_time:
+                max_time = r["time"]
+        else:
+            lines.append(f"  Request {r['index']}: FAILED ({r['error']})")
+
+    if n_ok:
+        avg_time = total_time / n_ok
+        speedup = (avg_time * n_ok) / wall_time if wall_time else 0.0
+        lines.append(f"Wall time: {wall_time:.2f}s")
+        lines.append(f"Average request time: {avg_time:.2f}s")
+        lines.append(f"Aggregate throughput: {total_tokens / wall_time:.2f} tok/s")
+        lines.append(f"Parallel speedup: {speedup:.2f}x")
+        if speedup < 1.5 and n_ok > 1:
+            lines.append("Requests appear to be sequential - check server batching")
+        else:
+            lines.append("Requests are processed in parallel")
+    logger.info("%s", "\n".join(lines))
+    return {"wall_time": wall_time, "results": results, "max_time": max_time}
+
+
+# Reference measurements from earlier benchmark runs:
+# (language, tests, avg time s, avg tokens, max_tokens)
+HISTORICAL_STATS = [
+    ("English", 8, 11.74, 175, 150),
+    ("French", 10, 12.03, 180, 150),
+]
+
+
+def analyze_test_results(stats=HISTORICAL_STATS):
+    """Summarize reference measurements as one table, one row per language."""
+    lines = ["=== Historical Test Results ===",
+             f"{'Language':<10}{'Tests':>6}{'Avg s':>8}{'Tokens':>8}"
+             f"{'tok/s':>8}{'Eff.':>7}"]
+    for language, tests, avg_time, tokens, max_tokens in stats:
+        if not avg_time or not max_tokens:
+            continue
+        lines.append(f"{language:<10}{tests:>6}{avg_time:>8.2f}{tokens:>8}"
+                     f"{tokens / avg_time:>8.2f}{tokens / max_tokens:>7.2f}")
+
+    total_tokens = sum(row[3] for row in stats)
+    total_time = sum(row[2] for row in stats)
+    if total_time:
+        lines.append(f"Aggregate throughput: {total_tokens / total_time:.2f} tok/s")
+    logger.info("%s", "\n".join(lines))
+
+
+async def main():
+    logger.info("Target: %s\nModel: %s", API_URL, MODEL)
+
+    # One session for the whole run so TCP+TLS connections are reused
+    # across probes instead of paying a handshake per request.
+    connector = aiohttp.TCPConnector(
+        limit=32, limit_per_host=32, keepalive_timeout=120
+    )
+    session = aiohttp.ClientSession(connector=connector)
+    try:
+        await test_single_request(session)
+        await test_streaming_request(session)
+        await test_concurrent_requests(session, 3)
+        await test_concurrent_requests(session, 6)
+        analyze_test_results()
+    finally:
+        await session.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main())